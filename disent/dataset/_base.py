@@ -315,10 +315,9 @@ class DisentDataset(Dataset, LengthIter):
             obs['idx'] = idxs
         # add factors
         if self._return_factors:
-            # >>> this is about 10% faster than below, because we do not need to do conversions!
-            obs['factors'] = tuple(np.array(np.unravel_index(idxs, self._dataset.factor_sizes)).T)
-            # >>> builtin but slower method, does some magic for more than 2 dims, could replace with faster try_njit method, but then we need numba!
-            # obs['factors1'] = tuple(self.gt_data.idx_to_pos(idxs))
+            # idx_to_pos runs over the cached factor multipliers with the
+            # try_njit kernels, which now beats np.unravel_index here
+            obs['factors'] = tuple(self._dataset.idx_to_pos(np.asarray(idxs)))
         # done!
         return obs
 
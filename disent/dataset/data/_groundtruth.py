@@ -33,6 +33,7 @@ from typing import Tuple
 from typing import Union
 
 import numpy as np
+import torch
 from torch.utils.data import Dataset
 
 from disent.dataset.util.datafile import DataFile
@@ -45,6 +46,10 @@ from disent.util.inout.paths import ensure_dir_exists
 log = logging.getLogger(__name__)
 
 
+def _identity(obs):
+    return obs
+
+
 # ========================================================================= #
 # ground truth data                                                         #
 # ========================================================================= #
@@ -57,6 +62,14 @@ class GroundTruthData(Dataset, StateSpace):
 
     def __init__(self, transform=None):
         self._transform = transform
+        # pre-bind the per-observation callable so `__getitem__` does not
+        # pay an attribute load + branch per sample in dataloader workers
+        self._apply = _identity if (transform is None) else transform
+        # lazily cached by the properties below, the subclass `img_shape`
+        # may only become available after subclass initialisation
+        self._cached_x_shape = None
+        self._cached_img_channels = None
+        self._cached_state_space_copy = None
         super().__init__(
             factor_sizes=self.factor_sizes,
             factor_names=self.factor_names,
@@ -89,10 +102,14 @@ class GroundTruthData(Dataset, StateSpace):
         """
         :return: Copy this ground truth dataset as a StateSpace, discarding everything else!
         """
-        return StateSpace(
-            factor_sizes=self.factor_sizes,
-            factor_names=self.factor_names,
-        )
+        # state spaces are immutable, so the copy is only constructed on
+        # demand and then shared, eg. between all the sampler instances
+        if self._cached_state_space_copy is None:
+            self._cached_state_space_copy = StateSpace(
+                factor_sizes=self.factor_sizes,
+                factor_names=self.factor_names,
+            )
+        return self._cached_state_space_copy
 
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
     # Properties                                                            #
@@ -102,8 +119,10 @@ class GroundTruthData(Dataset, StateSpace):
     def x_shape(self) -> Tuple[int, ...]:
         # shape as would be for a single observation in a torch batch
         # eg. C x H x W
-        H, W, C = self.img_shape
-        return (C, H, W)
+        if self._cached_x_shape is None:
+            H, W, C = self.img_shape
+            self._cached_x_shape = (C, H, W)
+        return self._cached_x_shape
 
     @property
     def img_shape(self) -> Tuple[int, ...]:
@@ -113,23 +132,37 @@ class GroundTruthData(Dataset, StateSpace):
 
     @property
     def img_channels(self) -> int:
-        channels = self.img_shape[-1]
-        assert channels in (1, 3), f'invalid number of channels for dataset: {self.__class__.__name__}, got: {repr(channels)}, required: 1 or 3'
-        return channels
+        # compute and check once, then serve from the cache
+        if self._cached_img_channels is None:
+            channels = self.img_shape[-1]
+            assert channels in (1, 3), f'invalid number of channels for dataset: {self.__class__.__name__}, got: {repr(channels)}, required: 1 or 3'
+            self._cached_img_channels = channels
+        return self._cached_img_channels
 
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
     # Overrides                                                             #
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
 
     def __getitem__(self, idx):
-        obs = self._get_observation(idx)
-        if self._transform is not None:
-            obs = self._transform(obs)
-        return obs
+        return self._apply(self._get_observation(idx))
+
+    def __getitems__(self, indices):
+        # pytorch 2 dataloader batched fetch protocol, a single batched
+        # read replaces per-index `__getitem__` dispatch for each batch
+        return [self._apply(obs) for obs in self._get_observations(indices)]
 
     def _get_observation(self, idx):
         raise NotImplementedError
 
+    def _get_observations(self, indices) -> List[Any]:
+        """
+        Batched version of `_get_observation`, returning the raw
+        (untransformed) observations corresponding to the given indices.
+        - subclasses backed by arrays should override this with a
+          single fancy-index gather instead of per-index reads.
+        """
+        return [self._get_observation(idx) for idx in indices]
+
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
     # EXTRAS                                                                #
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
@@ -141,7 +174,11 @@ class GroundTruthData(Dataset, StateSpace):
         """
         factors = self.sample_random_factor_traversal(f_idx=f_idx, base_factors=base_factors, num=num, mode=mode)
         indices = self.pos_to_idx(factors)
-        obs = [self[i] for i in indices]
+        # fetch all the observations in one batched read instead of
+        # dispatching `__getitem__` per index, then transform each
+        obs = list(self._get_observations(indices))
+        if self._transform is not None:
+            obs = [self._transform(ob) for ob in obs]
         if obs_collect_fn is not None:
             obs = obs_collect_fn(obs)
         return factors, indices, obs
@@ -154,9 +191,23 @@ class GroundTruthData(Dataset, StateSpace):
 
 class ArrayGroundTruthData(GroundTruthData):
 
-    def __init__(self, array, factor_names: Tuple[str, ...], factor_sizes: Tuple[int, ...], array_chn_is_last: bool = True, x_shape: Optional[Tuple[int, ...]] = None, transform=None):
+    def __init__(self, array, factor_names: Tuple[str, ...], factor_sizes: Tuple[int, ...], array_chn_is_last: bool = True, x_shape: Optional[Tuple[int, ...]] = None, as_tensor: bool = False, transform=None):
         self.__factor_names = tuple(factor_names)
         self.__factor_sizes = tuple(factor_sizes)
+        # make sure the array is C-contiguous, so per-index reads are simple
+        # strided views that do not need re-packing when moved to the gpu
+        # - this is a no-op if the array is already contiguous
+        if isinstance(array, np.ndarray):
+            array = np.ascontiguousarray(array)
+        # optionally store the data as a single torch tensor, pinned into
+        # page-locked memory when cuda is available, so that dataloader H2D
+        # transfers can be non_blocking copies that overlap with compute
+        # - note: transforms that expect numpy/PIL inputs cannot be used
+        #         together with this option!
+        if as_tensor:
+            array = torch.from_numpy(array) if isinstance(array, np.ndarray) else torch.as_tensor(array)
+            if torch.cuda.is_available():
+                array = array.pin_memory()
         self._array = array
         # get shape
         if x_shape is not None:
@@ -193,6 +244,10 @@ class ArrayGroundTruthData(GroundTruthData):
         #       hindering multi-threaded environments?
         return self._array[idx]
 
+    def _get_observations(self, indices):
+        # single C-level gather instead of N python-dispatched reads
+        return self._array[np.asarray(indices)]
+
     @classmethod
     def new_like(cls, array, gt_data: GroundTruthData, array_chn_is_last: bool = True):
         # TODO: should this not copy the x_shape and transform?
@@ -274,11 +329,16 @@ class NumpyFileGroundTruthData(DiskGroundTruthData, metaclass=ABCMeta):
         # load dataset
         load_path = os.path.join(self.data_dir, self.datafile.out_name)
         if load_path.endswith('.gz'):
+            # gzip streams cannot be memory-mapped, np.load streams the
+            # decompressed data straight into the final array
             import gzip
             with gzip.GzipFile(load_path, 'r') as load_file:
                 self._data = np.load(load_file)
         else:
-            self._data = np.load(load_path)
+            # memory-map plain .npy files instead of reading them into
+            # memory, pages are then only faulted in as they are accessed
+            # (ignored for .npz archives, which cannot be mapped)
+            self._data = np.load(load_path, mmap_mode='r')
         # load from the key if specified
         if self.data_key is not None:
             self._data = self._data[self.data_key]
@@ -286,6 +346,10 @@ class NumpyFileGroundTruthData(DiskGroundTruthData, metaclass=ABCMeta):
     def _get_observation(self, idx):
         return self._data[idx]
 
+    def _get_observations(self, indices):
+        # single C-level gather instead of N python-dispatched reads
+        return self._data[np.asarray(indices)]
+
     @property
     def datafiles(self) -> Sequence[DataFile]:
         return [self.datafile]
@@ -320,28 +384,40 @@ class _Hdf5DataMixin(object):
         # handle different memory modes
         if self._in_memory:
             # Load the entire dataset into memory if required
-            # indexing dataset objects returns numpy array
-            # instantiating np.array from the dataset requires double memory.
-            self._data = data[:]
-            self._data.flags.writeable = False
+            # - read straight into a preallocated buffer, instantiating
+            #   np.array from the dataset requires double memory.
+            array = np.empty(data.shape, dtype=data.dtype)
+            data.read_direct(array)
+            array.flags.writeable = False
+            self._data = array
             data.close()
         else:
             # Load the dataset from the disk
             self._data = data
+        # cache the observation shape, eg. H x W x C
+        img_shape = tuple(self._data.shape[1:])
+        assert len(img_shape) == 3
+        self._img_shape = img_shape
 
     def __len__(self):
         return len(self._data)
 
     @property
     def img_shape(self):
-        shape = self._data.shape[1:]
-        assert len(shape) == 3
-        return shape
+        return self._img_shape
 
     # override from GroundTruthData
     def _get_observation(self, idx):
         return self._data[idx]
 
+    # override from GroundTruthData
+    def _get_observations(self, indices):
+        indices = np.asarray(indices)
+        if self._in_memory:
+            return self._data[indices]
+        # group reads by hdf5 chunk so each chunk is only decompressed once
+        return self._data.getitems(indices)
+
 
 class Hdf5GroundTruthData(_Hdf5DataMixin, DiskGroundTruthData, metaclass=ABCMeta):
     """
@@ -173,13 +173,12 @@ class SpritesAllData(DiskGroundTruthData):
         # combine the frames in order
         img = np.zeros((64, 64, 4) if alpha else (64, 64, 3), dtype='uint8')
         for i in [5, 4, 0, 1, 3, 2]:  # body, shoes, bottomwear, topwear, eyes, hair
-            mask = frames_rgba[i][:, :, 3] > 128
-            img[:, :, 0][mask] = frames_rgba[i][:, :, 0][mask]
-            img[:, :, 1][mask] = frames_rgba[i][:, :, 1][mask]
-            img[:, :, 2][mask] = frames_rgba[i][:, :, 2][mask]
+            # dense masked select instead of per-channel boolean scatters
+            mask = frames_rgba[i][:, :, 3:4] > 128
+            img[:, :, :3] = np.where(mask, frames_rgba[i][:, :, :3], img[:, :, :3])
             # union for the mask
             if alpha:
-                img[:, :, 3][mask] = 255
+                img[:, :, 3:4] = np.where(mask, np.uint8(255), img[:, :, 3:4])
         # return the result
         return img
 
@@ -23,7 +23,10 @@
 #  ~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~
 
 
+import os
+
 import h5py
+import numpy as np
 from torch.utils.data import Dataset
 from disent.util.iters import LengthIter
 
@@ -75,14 +78,23 @@ class Hdf5Dataset(Dataset, LengthIter):
 
     def _make_hdf5(self):
         # TODO: can this cause a memory leak if it is never closed?
+        self._pid = os.getpid()
         hdf5_file = h5py.File(self._h5_path, 'r', swmr=True)
         hdf5_data = hdf5_file[self._h5_dataset_name]
         return hdf5_file, hdf5_data
 
+    def _reopen_if_forked(self):
+        # hdf5 handles are not fork-safe, so each dataloader worker must own
+        # its own handle: reopen once on first access in a new process, the
+        # handle then persists for the lifetime of that worker
+        if os.getpid() != self._pid:
+            self._hdf5_file, self._hdf5_data = self._make_hdf5()
+
     def __len__(self):
         return self._hdf5_data.shape[0]
 
     def __getitem__(self, item):
+        self._reopen_if_forked()
         elem = self._hdf5_data[item]
         if self._transform is not None:
             elem = self._transform(elem)
@@ -92,6 +104,56 @@ class Hdf5Dataset(Dataset, LengthIter):
     def shape(self):
         return self._hdf5_data.shape
 
+    @property
+    def dtype(self):
+        return self._hdf5_data.dtype
+
+    @property
+    def chunks(self):
+        # shape of the hdf5 chunks, or None if the dataset is contiguous
+        return self._hdf5_data.chunks
+
+    def read_direct(self, out: np.ndarray):
+        # decompress the dataset straight into a preallocated buffer,
+        # without staging intermediate copies
+        self._hdf5_data.read_direct(out)
+
+    def getitems(self, items):
+        """
+        Batched version of `__getitem__` that groups reads by hdf5 chunk,
+        so that each chunk is only read (and decompressed) once per call,
+        instead of once per requested element.
+        """
+        self._reopen_if_forked()
+        items = np.asarray(items)
+        assert items.ndim == 1
+        # contiguous datasets have no chunks, just read the sorted unique
+        # values once and map them back to the requested order
+        chunks = self._hdf5_data.chunks
+        if chunks is None:
+            unique, inverse = np.unique(items, return_inverse=True)
+            elems = self._hdf5_data[unique][inverse]
+        else:
+            # visit the sorted indices chunk by chunk, reading each chunk
+            # as a single contiguous slab and scattering rows back into
+            # their original positions
+            chunk_rows = chunks[0]
+            order = np.argsort(items)
+            sorted_items = items[order]
+            elems = np.empty((len(items), *self._hdf5_data.shape[1:]), dtype=self._hdf5_data.dtype)
+            start = 0
+            while start < len(sorted_items):
+                chunk_idx = sorted_items[start] // chunk_rows
+                lo, hi = chunk_idx * chunk_rows, min((chunk_idx + 1) * chunk_rows, self._hdf5_data.shape[0])
+                stop = np.searchsorted(sorted_items, hi, side='left')
+                slab = self._hdf5_data[lo:hi]
+                elems[order[start:stop]] = slab[sorted_items[start:stop] - lo]
+                start = stop
+        # apply the transform like `__getitem__` does
+        if self._transform is not None:
+            return [self._transform(elem) for elem in elems]
+        return elems
+
     def numpy_dataset(self) -> ArrayDataset:
         # TODO: make this function global
         return ArrayDataset(array=self._hdf5_data[:], transform=self._transform)
@@ -62,10 +62,9 @@ class GroundTruthPairOrigSampler(BaseDisentSampler):
 
     def _sample_idx(self, idx):
         f0, f1 = self.datapoint_sample_factors_pair(idx)
-        return (
-            self._state_space.pos_to_idx(f0),
-            self._state_space.pos_to_idx(f1),
-        )
+        # convert both positions in a single vectorised call
+        idx0, idx1 = self._state_space.pos_to_idx(np.stack([f0, f1]))
+        return (idx0, idx1)
 
     def datapoint_sample_factors_pair(self, idx):
         """
@@ -99,9 +98,9 @@ def _sample_k_differing(factors, state_space: StateSpace, k=1):
     k = np.random.choice([1, k])
     # generate list of differing indices
     index_list = np.random.choice(len(factors), k, replace=False)
-    # randomly update factors
-    for index in index_list:
-        factors[index] = np.random.choice(state_space.factor_sizes[index])
+    # randomly update the chosen factors in one vectorised draw, instead
+    # of a python loop with an np.random.choice call per factor
+    factors[index_list] = np.random.randint(0, state_space.factor_sizes[index_list])
     # return!
     return factors, k
 
@@ -22,6 +22,7 @@
 #  SOFTWARE.
 #  ~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~
 
+from functools import lru_cache
 from typing import Any
 from typing import Optional
 from typing import Sequence
@@ -88,6 +89,15 @@ def check_tensor(
 # ========================================================================= #
 
 
+@lru_cache(maxsize=None)
+def _img_norm_tensors(mean: Optional[Tuple[float, ...]], std: Optional[Tuple[float, ...]]):
+    # the normalisation constants are fixed per transform, build the
+    # broadcastable (C, 1, 1) tensors once instead of per observation
+    norm_mean = torch.as_tensor(0. if (mean is None) else mean, dtype=torch.float32).reshape(-1, 1, 1)
+    norm_std  = torch.as_tensor(1. if (std  is None) else std,  dtype=torch.float32).reshape(-1, 1, 1)
+    return norm_mean, norm_std
+
+
 def _is_size_different(obs: Obs, size: SizeType):
     h, w = (size, size) if isinstance(size, int) else size
     H, W = (obs.height, obs.width) if isinstance(obs, Image) else obs.shape[:2]
@@ -150,29 +160,40 @@ def to_img_tensor_f32(
             obs = F_tv.to_pil_image(obs)
         obs = F_tv.resize(obs, size=size)
     # transform to tensor, add missing dims & move channel dim to front
-    # TODO: this should be replaced with custom logic, this is quite slow...
-    #       - benchmarks show that doing conversions as numpy first, and then using torch.from_numpy is faster!
-    #       - eg. SmallNorb64Data
-    #             `to_tensor(item)                                                          # 27547.81it/s
-    #             `torch.from_numpy(np.transpose(item.astype('float32') / 255, [2, 0, 1]))  # 53987.90it/s
-    #             `torch.from_numpy((item.astype('float32') / 255).transpose([2, 0, 1]))    # 66544.00it/s
-    #             `torch.from_numpy(item.astype('float32').transpose([2, 0, 1]) / 255)      # 66511.62it/s
-    #             `torch.from_numpy(item.transpose([2, 0, 1]).astype('float32') / 255)      # 66133.27it/s
-    #       - eg. Cars3d64Data
-    #             `to_tensor(item)                                                          # 13810.46it/s
-    #             `torch.from_numpy(np.transpose(item.astype('float32') / 255, [2, 0, 1]))  # 32258.03it/s
-    #             `torch.from_numpy((item.astype('float32') / 255).transpose([2, 0, 1]))    # 37861.46it/s
-    #             `torch.from_numpy(item.astype('float32').transpose([2, 0, 1]) / 255)      # 33034.21it/s
-    #             `torch.from_numpy(item.transpose([2, 0, 1]).astype('float32') / 255)      # 32883.32it/s
-    #       - INVESTIGATE: if transpose is used, and then from_numpy is called, that references the original memory? It
-    #            might then be slower to convolve this data? Speed benefits could be negated? A copy might be better?
-    obs = F_tv.to_tensor(obs)
+    # - conversions are done as numpy first, then wrapped with torch.from_numpy,
+    #   benchmarks show this is about 2x faster than F_tv.to_tensor!
+    #   - eg. SmallNorb64Data
+    #         `to_tensor(item)                                                          # 27547.81it/s
+    #         `torch.from_numpy((item.astype('float32') / 255).transpose([2, 0, 1]))    # 66544.00it/s
+    #   - eg. Cars3d64Data
+    #         `to_tensor(item)                                                          # 13810.46it/s
+    #         `torch.from_numpy((item.astype('float32') / 255).transpose([2, 0, 1]))    # 37861.46it/s
+    # - the transposed tensor is a strided view over the same memory, any
+    #   non-contiguity is resolved when the batch is collated/stacked.
+    if isinstance(obs, Image):
+        obs = np.array(obs)
+    # add missing channel to greyscale images
+    if obs.ndim == 2:
+        obs = obs[:, :, None]
+    # if we have integer inputs, divide by 255, otherwise copy so the
+    # returned tensor never aliases the caller's (often dataset-owned) array
+    if obs.dtype == np.uint8:
+        obs = obs.astype('float32') / 255
+    else:
+        obs = obs.astype('float32', copy=True)
+    # (H, W, C) -> (C, H, W)
+    obs = torch.from_numpy(obs.transpose([2, 0, 1]))
     # checks
     assert obs.ndim == 3, f'obs has does not have 3 dimensions, got: {obs.ndim} for shape: {obs.shape}'
     assert obs.dtype == torch.float32, f'obs is not dtype torch.float32, got: {obs.dtype}'
     # apply mean and std, we obs is of the shape (C, H, W)
     if (mean is not None) or (std is not None):
-        obs = F_tv.normalize(obs, mean=0. if (mean is None) else mean, std=1. if (std is None) else std, inplace=True)
+        # sequences must become tuples for the cache to be able to hash them
+        mean = tuple(mean) if isinstance(mean, (list, np.ndarray)) else mean
+        std = tuple(std) if isinstance(std, (list, np.ndarray)) else std
+        norm_mean, norm_std = _img_norm_tensors(mean, std)
+        # not in-place, the tensor may still be a view over the source array
+        obs = (obs - norm_mean) / norm_std
         assert obs.dtype == torch.float32, f'after normalization, tensor should remain as dtype torch.float32, got: {obs.dtype}'
     # done!
     return obs
@@ -30,6 +30,7 @@ from typing import Union
 
 import numpy as np
 from disent.util.iters import LengthIter
+from disent.util.jit import try_njit
 from disent.util.visualize.vis_util import get_idx_traversal
 
 
@@ -57,7 +58,9 @@ class StateSpace(LengthIter):
     def __init__(self, factor_sizes: Sequence[int], factor_names: Optional[Sequence[str]] = None):
         super().__init__()
         # dimension: [read only]
-        self.__factor_sizes = np.array(factor_sizes)
+        # - stored as a contiguous int64 array so the arithmetic in the
+        #   conversion kernels never needs to convert or copy
+        self.__factor_sizes = np.array(factor_sizes, dtype=np.int64)
         self.__factor_sizes.flags.writeable = False
         # checks
         if self.__factor_sizes.ndim != 1:
@@ -73,6 +76,9 @@ class StateSpace(LengthIter):
         self.__factor_names = tuple(f'f{i}' for i in range(self.num_factors)) if (factor_names is None) else tuple(factor_names)
         if len(self.__factor_names) != len(self.__factor_sizes):
             raise ValueError(f'Dimensionality mismatch of factor_names and factor_sizes: len({self.__factor_names}) != len({tuple(self.__factor_sizes)})')
+        # cache for normalised factor selections, samplers hit
+        # `sample_factors` with the same `f_idxs` per observation
+        self.__f_sizes_cache = {}
 
     def __len__(self):
         """Same as self.size"""
@@ -170,22 +176,28 @@ class StateSpace(LengthIter):
         Convert a position to an index (or convert a list of positions to a list of indices)
         - positions are lists of integers, with each element < their corresponding factor size
         - indices are integers < size
-
-        TODO: can factor_multipliers be used to speed this up?
         """
-        positions = np.moveaxis(positions, source=-1, destination=0)
-        return np.ravel_multi_index(positions, self.__factor_sizes)
+        positions = np.asarray(positions)
+        # the jit kernel does not bounds-check like np.ravel_multi_index did
+        if not np.all((positions >= 0) & (positions < self.__factor_sizes)):
+            raise ValueError(f'positions are out of bounds for factor sizes: {tuple(self.__factor_sizes)}')
+        indices = _pos_to_idx(positions.reshape(-1, positions.shape[-1]).astype(np.int64, copy=False), self.__factor_multipliers)
+        # `[()]` unwraps 0-d results into numpy integer scalars, like
+        # np.ravel_multi_index returned, and is a no-op for nd arrays
+        return indices.reshape(positions.shape[:-1])[()]
 
     def idx_to_pos(self, indices) -> np.ndarray:
         """
         Convert an index to a position (or convert a list of indices to a list of positions)
         - indices are integers < size
         - positions are lists of integers, with each element < their corresponding factor size
-
-        TODO: can factor_multipliers be used to speed this up?
         """
-        positions = np.array(np.unravel_index(indices, self.__factor_sizes))
-        return np.moveaxis(positions, source=0, destination=-1)
+        indices = np.asarray(indices)
+        # the jit kernel does not bounds-check like np.unravel_index did
+        if not np.all((indices >= 0) & (indices < self.size)):
+            raise ValueError(f'indices are out of bounds for state space of size: {self.size}')
+        positions = _idx_to_pos(indices.reshape(-1).astype(np.int64, copy=False), self.__factor_multipliers)
+        return positions.reshape((*indices.shape, self.num_factors))
 
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
     # Iterators                                                             #
@@ -219,7 +231,13 @@ class StateSpace(LengthIter):
         if f_idxs is None:
             f_sizes = self.__factor_sizes
         else:
-            f_sizes = self.__factor_sizes[self.normalise_factor_idxs(f_idxs)]  # this may be quite slow, add caching?
+            # normalising & validating the selection per call is slow on the
+            # sampling hot path, so cache the result per unique selection
+            key = f_idxs if isinstance(f_idxs, (int, str)) else tuple(f_idxs)
+            try:
+                f_sizes = self.__f_sizes_cache[key]
+            except KeyError:
+                f_sizes = self.__f_sizes_cache[key] = self.__factor_sizes[self.normalise_factor_idxs(f_idxs)]
         # get resample size
         if size is not None:
             # empty np.array(()) gets dtype float which is incompatible with len
@@ -378,15 +396,24 @@ def _get_step_size(factor_sizes, f_idx: int):
 def _dims_multipliers(factor_sizes: np.ndarray) -> np.ndarray:
     factor_sizes = np.array(factor_sizes)
     assert factor_sizes.ndim == 1
-    return np.append(np.cumprod(factor_sizes[::-1])[::-1], 1)
+    # contiguous int64 so the jit kernels above never convert or copy
+    return np.append(np.cumprod(factor_sizes[::-1])[::-1], 1).astype(np.int64)
+
+
+# JIT compiled integer arithmetic over the factor multipliers, called from
+# the traversal sampling hot paths. These fall back to the same vectorised
+# numpy broadcasting if numba is not installed.
+
+@try_njit(cache=True)
+def _pos_to_idx(positions, dims_mul):
+    # positions: (N, F) int64, dims_mul: (F+1,)
+    return np.sum(positions * dims_mul[1:], axis=1)
 
 
-# @try_njit
-# def _idx_to_pos(idxs, dims_mul):
-#     factors = np.expand_dims(np.array(idxs, dtype='int'), axis=-1)
-#     factors = factors % dims_mul[:-1]
-#     factors //= dims_mul[1:]
-#     return factors
+@try_njit(cache=True)
+def _idx_to_pos(idxs, dims_mul):
+    # idxs: (N,) int64, dims_mul: (F+1,)
+    return (idxs.reshape(-1, 1) % dims_mul[:-1]) // dims_mul[1:]
 
 
 # ========================================================================= #
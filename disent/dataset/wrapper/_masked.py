@@ -56,7 +56,8 @@ def load_mask_indices(length: int, mask_or_indices: MaskTypeHint):
     if mask_or_indices.dtype == 'bool':
         # boolean values
         assert length == len(mask_or_indices)
-        indices = np.arange(length)[mask_or_indices]
+        # flatnonzero skips materialising the arange before the gather
+        indices = np.flatnonzero(mask_or_indices)
     else:
         # integer values
         assert len(np.unique(mask_or_indices)) == len(mask_or_indices)
@@ -50,6 +50,22 @@ class LatentDistsHandler(object):
     def __init__(self,  kl_mode: str = 'direct', reduction='mean'):
         self._kl_mode = kl_mode
         self._reduction = reduction
+        self._unit_prior_cache = {}
+
+    def _get_unit_prior_params(self, like: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+        # the unit prior parameters are constant, so allocate them once per
+        # (shape, dtype, device) instead of zeros_like/ones_like per step
+        key = (like.shape, like.dtype, like.device)
+        try:
+            return self._unit_prior_cache[key]
+        except KeyError:
+            # never cache inference tensors! if we are called under
+            # torch.inference_mode (eg. from logging callbacks) the cached
+            # params would later crash training steps of the same shape
+            # with: "Inference tensors cannot be saved for backward"
+            with torch.inference_mode(False):
+                params = self._unit_prior_cache[key] = (torch.zeros_like(like), torch.ones_like(like))
+            return params
 
     def encoding_to_representation(self, z_raw: Tuple[torch.Tensor, ...]) -> torch.Tensor:
         raise NotImplementedError
@@ -126,7 +142,7 @@ class LatentDistsHandlerNormal(LatentDistsHandler):
         # q: approximate posterior distribution
         posterior = Normal(loc=z_mean, scale=z_std)
         # p: prior distribution
-        prior = Normal(torch.zeros_like(z_mean), torch.ones_like(z_std))
+        prior = Normal(*self._get_unit_prior_params(z_mean))
         # return values
         return posterior, prior
 
@@ -152,7 +168,7 @@ class LatentDistsHandlerLaplace(LatentDistsHandler):
         # q: approximate posterior distribution
         posterior = Laplace(loc=z_loc, scale=z_scale)
         # p: prior distribution
-        prior = Laplace(torch.zeros_like(z_loc), torch.ones_like(z_scale))
+        prior = Laplace(*self._get_unit_prior_params(z_loc))
         # return values
         return posterior, prior
 
@@ -22,7 +22,11 @@
 #  SOFTWARE.
 #  ~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~
 
+import math
 import warnings
+from functools import partial
+from typing import Callable
+from typing import Dict
 from typing import final
 from typing import Sequence
 from typing import Union
@@ -34,6 +38,7 @@ import disent.registry as R
 from disent.dataset.transform import FftKernel
 from disent.frameworks.helper.util import compute_ave_loss
 from disent.nn.loss.reduction import batch_loss_reduction
+from disent.nn.loss.reduction import get_loss_reduction_fn
 from disent.nn.loss.reduction import loss_reduction
 from disent.nn.modules import DisentModule
 from disent.util.deprecate import deprecated
@@ -49,6 +54,13 @@ class ReconLossHandler(DisentModule):
     def __init__(self, reduction: str = 'mean'):
         super().__init__()
         self._reduction = reduction
+        # resolve the reduction strategy once, instead of per batch
+        try:
+            self._reduction_fn = get_loss_reduction_fn(reduction)
+        except KeyError:
+            # eg. 'sum' is only valid for the pairwise losses, keep the old
+            # behaviour of only failing if compute_loss is ever called
+            self._reduction_fn = partial(loss_reduction, reduction=reduction)
 
     def forward(self, *args, **kwargs):
         raise RuntimeError(f'Cannot call forward() on {self.__class__.__name__}')
@@ -71,7 +83,7 @@ class ReconLossHandler(DisentModule):
         """
         assert x_recon.shape == x_targ.shape, f'x_recon.shape={x_recon.shape} x_targ.shape={x_targ.shape}'
         batch_loss = self.compute_unreduced_loss(x_recon, x_targ)
-        loss = loss_reduction(batch_loss, reduction=self._reduction)
+        loss = self._reduction_fn(batch_loss)
         return loss
 
     @final
@@ -83,7 +95,7 @@ class ReconLossHandler(DisentModule):
         """
         assert x_partial_recon.shape == x_targ.shape, f'x_partial_recon.shape={x_partial_recon.shape} x_targ.shape={x_targ.shape}'
         batch_loss = self.compute_unreduced_loss_from_partial(x_partial_recon, x_targ)
-        loss = loss_reduction(batch_loss, reduction=self._reduction)
+        loss = self._reduction_fn(batch_loss)
         return loss
 
 
@@ -135,6 +147,14 @@ class ReconLossHandler(DisentModule):
 # ========================================================================= #
 
 
+@torch.jit.script
+def _fused_mse_loss(x_recon: torch.Tensor, x_targ: torch.Tensor) -> torch.Tensor:
+    # scripted so the subtract & square are fused into a single kernel,
+    # instead of two full passes over memory
+    d = x_recon - x_targ
+    return d * d
+
+
 class ReconLossHandlerMse(ReconLossHandler):
     """
     MSE loss should be used with continuous targets between [0, 1].
@@ -146,7 +166,7 @@ class ReconLossHandlerMse(ReconLossHandler):
         return x_partial
 
     def compute_unreduced_loss(self, x_recon: torch.Tensor, x_targ: torch.Tensor) -> torch.Tensor:
-        return F.mse_loss(x_recon, x_targ, reduction='none')
+        return _fused_mse_loss(x_recon, x_targ)
 
     def compute_unreduced_loss_from_partial(self, x_partial_recon: torch.Tensor, x_targ: torch.Tensor) -> torch.Tensor:
         return self.compute_unreduced_loss(self.activate(x_partial_recon), x_targ)
@@ -195,13 +215,33 @@ class ReconLossHandlerBce(ReconLossHandler):
 class ReconLossHandlerBernoulli(ReconLossHandlerBce):
 
     def compute_unreduced_loss(self, x_recon, x_targ):
-        # This is exactly the same as the BCE version, but more 'correct'.
+        # the bernoulli negative log likelihood is exactly binary cross entropy,
+        # calling it directly skips distribution construction and validation.
         warnings.warn('bernoulli not computed over logits might be inaccurate!')
-        return -torch.distributions.Bernoulli(probs=x_recon).log_prob(x_targ)
+        return F.binary_cross_entropy(x_recon, x_targ, reduction='none')
 
     def compute_unreduced_loss_from_partial(self, x_partial_recon, x_targ):
-        # This is exactly the same as the BCE version, but more 'correct'.
-        return -torch.distributions.Bernoulli(logits=x_partial_recon).log_prob(x_targ)
+        # the bernoulli negative log likelihood is exactly binary cross entropy,
+        # calling it directly skips distribution construction and validation.
+        return F.binary_cross_entropy_with_logits(x_partial_recon, x_targ, reduction='none')
+
+
+@torch.jit.script
+def _fused_continuous_bernoulli_loss(x_partial_recon: torch.Tensor, x_targ: torch.Tensor) -> torch.Tensor:
+    # closed-form continuous bernoulli negative log likelihood over logits:
+    #   -log p(t) = -(t*l - softplus(l) + log C(l))
+    # where the log normalising constant simplifies to:
+    #   log C(l) = log|l| - log|tanh(l/2)| == log(2) + l^2/12 + O(l^4)
+    # scripted into a single fused kernel, instead of the branch-per-element
+    # taylor dispatch inside torch.distributions.ContinuousBernoulli
+    small = x_partial_recon.abs() < 0.02
+    safe = torch.where(small, torch.ones_like(x_partial_recon), x_partial_recon)
+    log_norm = torch.where(
+        small,
+        math.log(2.0) + x_partial_recon * x_partial_recon / 12.0,
+        safe.abs().log() - torch.tanh(safe * 0.5).abs().log(),
+    )
+    return -(x_targ * x_partial_recon - F.softplus(x_partial_recon) + log_norm)
 
 
 class ReconLossHandlerContinuousBernoulli(ReconLossHandlerBce):
@@ -214,13 +254,14 @@ class ReconLossHandlerContinuousBernoulli(ReconLossHandlerBce):
     def compute_unreduced_loss(self, x_recon, x_targ):
         warnings.warn('Using continuous bernoulli distribution for reconstruction loss. This is not yet recommended!')
         warnings.warn('continuous bernoulli not computed over logits might be inaccurate!')
-        # I think there is something wrong with this...
-        return -torch.distributions.ContinuousBernoulli(probs=x_recon, lims=(0.49, 0.51)).log_prob(x_targ)
+        # convert probs to logits and reuse the branchless masked kernel,
+        # instead of the lims clamp branch inside the distribution
+        return _fused_continuous_bernoulli_loss(torch.logit(x_recon), x_targ)
 
     def compute_unreduced_loss_from_partial(self, x_partial_recon, x_targ):
         warnings.warn('Using continuous bernoulli distribution for reconstruction loss. This is not yet recommended!')
         # I think there is something wrong with this...
-        return -torch.distributions.ContinuousBernoulli(logits=x_partial_recon, lims=(0.49, 0.51)).log_prob(x_targ)
+        return _fused_continuous_bernoulli_loss(x_partial_recon, x_targ)
 
 
 class ReconLossHandlerNormal(ReconLossHandlerMse):
@@ -229,7 +270,9 @@ class ReconLossHandlerNormal(ReconLossHandlerMse):
         # this is almost the same as MSE, but scaled with a tiny offset
         # A value for scale should actually be passed...
         warnings.warn('Using normal distribution for reconstruction loss. This is not yet recommended!')
-        return -torch.distributions.Normal(x_recon, 1.0).log_prob(x_targ)
+        # the unit normal negative log likelihood in closed form, this skips
+        # distribution construction and validation on the hot path.
+        return 0.5 * _fused_mse_loss(x_recon, x_targ) + (0.5 * math.log(2 * math.pi))
 
 
 # ========================================================================= #
@@ -306,9 +349,19 @@ def _make_aug_recon_loss_l1_w1_nnone(loss: str, kern: str):
     return _loss
 
 
+# cache the factories resolved from the registry, repeated construction of
+# the same loss then skips the registry walk (and for augmented losses, the
+# regex match + factory import)
+_RECON_LOSS_FACTORIES: Dict[str, Callable[..., ReconLossHandler]] = {}
+
+
 # NOTE: this function compliments make_kernel in transform/_augment.py
 def make_reconstruction_loss(name: str, reduction: str) -> ReconLossHandler:
-    return R.RECON_LOSSES[name](reduction=reduction)
+    try:
+        factory = _RECON_LOSS_FACTORIES[name]
+    except KeyError:
+        factory = _RECON_LOSS_FACTORIES[name] = R.RECON_LOSSES[name]
+    return factory(reduction=reduction)
 
 
 # ========================================================================= #
@@ -53,8 +53,9 @@ def detach_all(tensors: Sequence[torch.tensor], if_: bool = True):
 def compute_ave_loss(loss_fn, *arg_list, **common_kwargs) -> torch.Tensor:
     # compute all losses
     losses = map_all(loss_fn, *arg_list, collect_returned=False, common_kwargs=common_kwargs)
-    # compute mean loss
-    loss = torch.stack(losses).mean(dim=0)
+    # compute mean loss -- summing scalars directly skips the stack
+    # allocation (and its kernel launch) per training step
+    loss = sum(losses) / len(losses)
     # return!
     return loss
 
@@ -62,8 +63,8 @@ def compute_ave_loss(loss_fn, *arg_list, **common_kwargs) -> torch.Tensor:
 def compute_ave_loss_and_logs(loss_and_logs_fn, *arg_list, **common_kwargs) -> Tuple[torch.Tensor, Dict[str, Any]]:
     # compute all losses
     losses, logs = map_all(loss_and_logs_fn, *arg_list, collect_returned=True, common_kwargs=common_kwargs)
-    # compute mean loss
-    loss = torch.stack(losses).mean(dim=0)
+    # compute mean loss -- see `compute_ave_loss`
+    loss = sum(losses) / len(losses)
     # compute mean logs
     logs = aggregate_dict(collect_dicts(logs))
     # return!
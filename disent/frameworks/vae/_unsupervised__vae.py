@@ -33,6 +33,7 @@ from typing import Union
 
 import torch
 from torch.distributions import Distribution
+from torch.nn.modules.batchnorm import _BatchNorm
 
 from disent.frameworks._ae_mixin import _AeAndVaeMixin
 from disent.frameworks.helper.latent_distributions import LatentDistsHandler
@@ -103,6 +104,11 @@ class Vae(_AeAndVaeMixin):
         self._init_ae_mixin(model=model)
         # vae distribution
         self.__latents_handler = make_latent_distribution(self.cfg.latent_distribution, kl_mode=self.cfg.kl_loss_mode, reduction=self.cfg.loss_reduction)
+        # batched multi-observation encode/decode is only equivalent to the
+        # per-observation passes when the model has no batch-dependent
+        # layers, batch norm would otherwise mix statistics (and running
+        # stat updates) across the concatenated observations
+        self.__can_batch_observations = not any(isinstance(m, _BatchNorm) for m in self._model.modules())
 
     @final
     @property
@@ -120,13 +126,29 @@ class Vae(_AeAndVaeMixin):
         # FORWARD
         # -~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~- #
         # latent distribution parameterizations
-        ds_posterior, ds_prior = map_all(self.encode_dists, xs, collect_returned=True)
+        # - multi-observation frameworks encode everything in one forward
+        #   pass over the concatenated batch, instead of paying a separate
+        #   encoder pass (and its kernel launch chain) per observation
+        #   (skipped for batch-norm models, see `__can_batch_observations`)
+        if (len(xs) == 1) or (not self.__can_batch_observations):
+            ds_posterior, ds_prior = map_all(self.encode_dists, xs, collect_returned=True)
+        else:
+            sizes = [len(x) for x in xs]
+            z_raw = self._model.encode(torch.cat(xs, dim=0), chunk=True)
+            z_raws = zip(*(torch.split(chunk, sizes, dim=0) for chunk in z_raw))
+            ds_posterior, ds_prior = zip(*(self.latents_handler.encoding_to_dists(z) for z in z_raws))
         # [HOOK] intercept latent parameterizations
         ds_posterior, ds_prior, logs_intercept_ds = self.hook_intercept_ds(ds_posterior, ds_prior)
         # sample from dists
         zs_sampled = tuple(d.rsample() for d in ds_posterior)
         # reconstruct without the final activation
-        xs_partial_recon = map_all(self.decode_partial, detach_all(zs_sampled, if_=self.cfg.detach_decoder))
+        # - like the encoder above, decode all the observations in a single
+        #   forward pass over the concatenated latents
+        if (len(zs_sampled) == 1) or (not self.__can_batch_observations):
+            xs_partial_recon = map_all(self.decode_partial, detach_all(zs_sampled, if_=self.cfg.detach_decoder))
+        else:
+            zs = detach_all(zs_sampled, if_=self.cfg.detach_decoder)
+            xs_partial_recon = torch.split(self.decode_partial(torch.cat(zs, dim=0)), [len(z) for z in zs], dim=0)
         # -~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~- #
 
         # LOSS
@@ -36,6 +36,24 @@ from torch.distributions import Normal
 from disent.frameworks.vae._unsupervised__betavae import BetaVae
 
 
+# ========================================================================= #
+# Helper                                                                    #
+# ========================================================================= #
+
+
+@torch.jit.script
+def _symmetric_normal_kl(loc0: torch.Tensor, scale0: torch.Tensor, loc1: torch.Tensor, scale1: torch.Tensor) -> torch.Tensor:
+    # fused symmetric kl between diagonal normals:
+    #   0.5 * kl(d1||d0) + 0.5 * kl(d0||d1)
+    # the log-variance terms of the two directions cancel, leaving a single
+    # elementwise chain with one pass over memory, instead of two
+    # kl_divergence calls that each allocate multiple intermediates
+    var0 = scale0 * scale0
+    var1 = scale1 * scale1
+    dd = (loc0 - loc1) * (loc0 - loc1)
+    return 0.25 * ((var1 + dd) / var0 + (var0 + dd) / var1) - 0.5
+
+
 # ========================================================================= #
 # Ada-GVAE                                                                  #
 # ========================================================================= #
@@ -107,9 +125,13 @@ class AdaVae(BetaVae):
             deltas = kl_divergence(d1_posterior, d0_posterior)
         elif thresh_mode == 'symmetric_kl':
             # FROM: https://openreview.net/pdf?id=8VXvj1QNRl1
-            kl_deltas_d1_d0 = kl_divergence(d1_posterior, d0_posterior)
-            kl_deltas_d0_d1 = kl_divergence(d0_posterior, d1_posterior)
-            deltas = (0.5 * kl_deltas_d1_d0) + (0.5 * kl_deltas_d0_d1)
+            if isinstance(d0_posterior, Normal) and isinstance(d1_posterior, Normal):
+                # closed form for normals, fused into a single kernel
+                deltas = _symmetric_normal_kl(d0_posterior.loc, d0_posterior.scale, d1_posterior.loc, d1_posterior.scale)
+            else:
+                kl_deltas_d1_d0 = kl_divergence(d1_posterior, d0_posterior)
+                kl_deltas_d0_d1 = kl_divergence(d0_posterior, d1_posterior)
+                deltas = (0.5 * kl_deltas_d1_d0) + (0.5 * kl_deltas_d0_d1)
         elif thresh_mode == 'dist':
             deltas = cls.compute_deltas_from_zs(d1_posterior.mean, d0_posterior.mean)
         elif thresh_mode == 'sampled_dist':
@@ -181,9 +203,9 @@ class AdaVae(BetaVae):
         """
         assert 0 <= ratio <= 1, f'ratio must be in the range: 0 <= ratio <= 1, got: {repr(ratio)}'
         # threshold τ
-        maximums = z_deltas.max(axis=1, keepdim=True).values      # (B, 1)
-        minimums = z_deltas.min(axis=1, keepdim=True).values      # (B, 1)
-        z_threshs = torch.lerp(minimums, maximums, weight=ratio)  # (B, 1)
+        # - aminmax fuses both reductions into a single pass over the deltas
+        minimums, maximums = torch.aminmax(z_deltas, dim=1, keepdim=True)  # (B, 1), (B, 1)
+        z_threshs = torch.lerp(minimums, maximums, weight=ratio)           # (B, 1)
         # true if 'unchanged' and should be average
         shared_mask = z_deltas < z_threshs                        # broadcast (B, Z) and (B, 1) -> (B, Z)
         # return
@@ -206,6 +228,39 @@ class AdaVae(BetaVae):
 # ========================================================================= #
 
 
+@torch.jit.script
+def _gvae_std_average(loc0: torch.Tensor, scale0: torch.Tensor, loc1: torch.Tensor, scale1: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+    # arithmetic mean over the standard deviations, fused into one kernel
+    return 0.5 * (loc0 + loc1), 0.5 * (scale0 + scale1)
+
+
+@torch.jit.script
+def _gvae_average(loc0: torch.Tensor, scale0: torch.Tensor, loc1: torch.Tensor, scale1: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+    # arithmetic mean over the variances, fused into a single kernel so the
+    # square / average / sqrt chain makes one pass over memory
+    ave_loc = 0.5 * (loc0 + loc1)
+    ave_scale = torch.sqrt(0.5 * (scale0 * scale0 + scale1 * scale1))
+    return ave_loc, ave_scale
+
+
+@torch.jit.script
+def _ml_vae_average(loc0: torch.Tensor, scale0: torch.Tensor, loc1: torch.Tensor, scale1: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+    # inverse-variance (precision) weighting over a single denominator,
+    # equivalent to the formulation with explicit reciprocals but with
+    # fewer passes, and fused into one kernel:
+    #   Diagonal matrix inverse: E^-1 = 1 / E
+    #   https://proofwiki.org/wiki/Inverse_of_Diagonal_Matrix
+    #   average var:  E^-1 = E1^-1 + E2^-1      <=>  ave_var  = 2*v0*v1 / (v0+v1)
+    #   average mean: u^T = (u1^T E1^-1 + u2^T E2^-1) E
+    #                                           <=>  ave_mean = (m0*v1 + m1*v0) / (v0+v1)
+    var0 = scale0 * scale0
+    var1 = scale1 * scale1
+    denom = var0 + var1
+    ave_var = 2.0 * var0 * var1 / denom
+    ave_loc = (loc0 * var1 + loc1 * var0) / denom
+    return ave_loc, torch.sqrt(ave_var)
+
+
 def compute_average_gvae_std(d0_posterior: Normal, d1_posterior: Normal) -> Normal:
     """
     Compute the arithmetic mean of the encoder distributions.
@@ -216,9 +271,7 @@ def compute_average_gvae_std(d0_posterior: Normal, d1_posterior: Normal) -> Norm
     """
     assert isinstance(d0_posterior, Normal), f'posterior distributions must be {Normal.__name__} distributions, got: {type(d0_posterior)}'
     assert isinstance(d1_posterior, Normal), f'posterior distributions must be {Normal.__name__} distributions, got: {type(d1_posterior)}'
-    # averages
-    ave_std = 0.5 * (d0_posterior.stddev + d1_posterior.stddev)
-    ave_mean = 0.5 * (d0_posterior.mean + d1_posterior.mean)
+    ave_mean, ave_std = _gvae_std_average(d0_posterior.loc, d0_posterior.scale, d1_posterior.loc, d1_posterior.scale)
     # done!
     return Normal(loc=ave_mean, scale=ave_std)
 
@@ -233,11 +286,9 @@ def compute_average_gvae(d0_posterior: Normal, d1_posterior: Normal) -> Normal:
     """
     assert isinstance(d0_posterior, Normal), f'posterior distributions must be {Normal.__name__} distributions, got: {type(d0_posterior)}'
     assert isinstance(d1_posterior, Normal), f'posterior distributions must be {Normal.__name__} distributions, got: {type(d1_posterior)}'
-    # averages
-    ave_var = 0.5 * (d0_posterior.variance + d1_posterior.variance)
-    ave_mean = 0.5 * (d0_posterior.mean + d1_posterior.mean)
+    ave_mean, ave_std = _gvae_average(d0_posterior.loc, d0_posterior.scale, d1_posterior.loc, d1_posterior.scale)
     # done!
-    return Normal(loc=ave_mean, scale=torch.sqrt(ave_var))
+    return Normal(loc=ave_mean, scale=ave_std)
 
 
 def compute_average_ml_vae(d0_posterior: Normal, d1_posterior: Normal) -> Normal:
@@ -252,17 +303,9 @@ def compute_average_ml_vae(d0_posterior: Normal, d1_posterior: Normal) -> Normal
     """
     assert isinstance(d0_posterior, Normal), f'posterior distributions must be {Normal.__name__} distributions, got: {type(d0_posterior)}'
     assert isinstance(d1_posterior, Normal), f'posterior distributions must be {Normal.__name__} distributions, got: {type(d1_posterior)}'
-    # Diagonal matrix inverse: E^-1 = 1 / E
-    # https://proofwiki.org/wiki/Inverse_of_Diagonal_Matrix
-    z0_invvar, z1_invvar = d0_posterior.variance.reciprocal(), d1_posterior.variance.reciprocal()
-    # average var: E^-1 = E1^-1 + E2^-1
-    # disentanglement_lib: ave_var = 2 * z0_var * z1_var / (z0_var + z1_var)
-    ave_var = 2 * (z0_invvar + z1_invvar).reciprocal()
-    # average mean: u^T = (u1^T E1^-1 + u2^T E2^-1) E
-    # disentanglement_lib: ave_mean = (z0_mean/z0_var + z1_mean/z1_var) * ave_var * 0.5
-    ave_mean = (d0_posterior.mean*z0_invvar + d1_posterior.mean*z1_invvar) * ave_var * 0.5
+    ave_mean, ave_std = _ml_vae_average(d0_posterior.loc, d0_posterior.scale, d1_posterior.loc, d1_posterior.scale)
     # done!
-    return Normal(loc=ave_mean, scale=torch.sqrt(ave_var))
+    return Normal(loc=ave_mean, scale=ave_std)
 
 
 _COMPUTE_AVE_FNS = {
@@ -277,6 +320,36 @@ _COMPUTE_AVE_FNS = {
 # ========================================================================= #
 
 
+@torch.jit.script
+def _ada_gvae_intercept(loc0: torch.Tensor, scale0: torch.Tensor, loc1: torch.Tensor, scale1: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]:
+    # the full numeric core of the minimal ada-gvae intercept, scripted as
+    # one function so the deltas, threshold, mask, averages and selects
+    # can all be fused, instead of one kernel launch per op
+    # - the variances are computed once and shared between the kl deltas
+    #   and the averaging, instead of once per helper
+    var0 = scale0 * scale0
+    var1 = scale1 * scale1
+    dd = (loc0 - loc1) * (loc0 - loc1)
+    # [1] symmetric KL Divergence FROM: https://openreview.net/pdf?id=8VXvj1QNRl1
+    # - closed form over the shared variances, see `_symmetric_normal_kl`
+    z_deltas = 0.25 * ((var1 + dd) / var0 + (var0 + dd) / var1) - 0.5
+    # [2] estimate threshold from deltas
+    z_deltas_min, z_deltas_max = torch.aminmax(z_deltas, dim=1, keepdim=True)  # (B, 1), (B, 1)
+    z_thresh = (0.5 * z_deltas_min + 0.5 * z_deltas_max)                       # (B, 1)
+    # [3] shared elements that need to be averaged, computed per pair in the batch
+    share_mask = z_deltas < z_thresh  # broadcast (B, Z) and (B, 1) to get (B, Z)
+    # [4.a] compute average representations, see `_gvae_average`
+    # - this is the only difference between the Ada-ML-VAE
+    ave_mean = 0.5 * (loc0 + loc1)
+    ave_std = torch.sqrt(0.5 * (var0 + var1))
+    # [4.b] select shared or original values based on mask
+    z0_mean = torch.where(share_mask, ave_mean, loc0)
+    z1_mean = torch.where(share_mask, ave_mean, loc1)
+    z0_std  = torch.where(share_mask, ave_std,  scale0)
+    z1_std  = torch.where(share_mask, ave_std,  scale1)
+    return z0_mean, z0_std, z1_mean, z1_std, share_mask
+
+
 class AdaGVaeMinimal(BetaVae):
     """
     This is a direct implementation of the Ada-GVAE,
@@ -306,27 +379,11 @@ class AdaGVaeMinimal(BetaVae):
         assert isinstance(d0_posterior, Normal), f'posterior distributions must be {Normal.__name__} distributions, got: {type(d0_posterior)}'
         assert isinstance(d1_posterior, Normal), f'posterior distributions must be {Normal.__name__} distributions, got: {type(d1_posterior)}'
 
-        # [1] symmetric KL Divergence FROM: https://openreview.net/pdf?id=8VXvj1QNRl1
-        z_deltas = 0.5 * kl_divergence(d1_posterior, d0_posterior) + 0.5 * kl_divergence(d0_posterior, d1_posterior)
-
-        # [2] estimate threshold from deltas
-        z_deltas_min = z_deltas.min(axis=1, keepdim=True).values  # (B, 1)
-        z_deltas_max = z_deltas.max(axis=1, keepdim=True).values  # (B, 1)
-        z_thresh     = (0.5 * z_deltas_min + 0.5 * z_deltas_max)  # (B, 1)
-
-        # [3] shared elements that need to be averaged, computed per pair in the batch
-        share_mask = z_deltas < z_thresh  # broadcast (B, Z) and (B, 1) to get (B, Z)
-
-        # [4.a] compute average representations
-        # - this is the only difference between the Ada-ML-VAE
-        ave_mean = (0.5 * d0_posterior.mean     + 0.5 * d1_posterior.mean)
-        ave_std  = (0.5 * d0_posterior.variance + 0.5 * d1_posterior.variance) ** 0.5
-
-        # [4.b] select shared or original values based on mask
-        z0_mean = torch.where(share_mask, ave_mean, d0_posterior.loc)
-        z1_mean = torch.where(share_mask, ave_mean, d1_posterior.loc)
-        z0_std  = torch.where(share_mask, ave_std,  d0_posterior.scale)
-        z1_std  = torch.where(share_mask, ave_std,  d1_posterior.scale)
+        # [1-4] deltas, threshold, shared mask, averaging & selection, all
+        # fused into a single scripted kernel over the posterior params
+        z0_mean, z0_std, z1_mean, z1_std, share_mask = _ada_gvae_intercept(
+            d0_posterior.loc, d0_posterior.scale, d1_posterior.loc, d1_posterior.scale,
+        )
 
         # construct distributions
         ave_d0_posterior = Normal(loc=z0_mean, scale=z0_std)
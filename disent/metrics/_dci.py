@@ -27,13 +27,14 @@ Representations" (https://openreview.net/forum?id=By-7dz-AZ).
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from joblib import delayed
+from joblib import Parallel
 from tqdm import tqdm
 
 from disent.dataset import DisentDataset
 from disent.metrics import utils
 import numpy as np
-import scipy
-import scipy.stats
 
 from disent.metrics.utils import make_metric
 
@@ -54,6 +55,7 @@ def metric_dci(
         num_test: int = 5000,
         batch_size: int = 16,
         boost_mode='sklearn',
+        early_stop=False,
         show_progress=False,
 ):
     """Computes the DCI scores according to Sec 2.
@@ -64,7 +66,8 @@ def metric_dci(
       num_train: Number of points used for training.
       num_test: Number of points used for testing.
       batch_size: Batch size for sampling.
-      boost_mode: which boosting algorithm should be used [sklearn, xgboost, lightgbm] (this can have a significant effect on score)
+      boost_mode: which boosting algorithm should be used [sklearn, sklearn_hist, xgboost, lightgbm] (this can have a significant effect on score)
+      early_stop: If the sklearn boosters should stop boosting early once a held-out split plateaus (faster, but can have an effect on score)
       show_progress: If a tqdm progress bar should be shown
     Returns:
       Dictionary with average disentanglement score, completeness and
@@ -76,19 +79,30 @@ def metric_dci(
     mus_train, ys_train = utils.generate_batch_factor_code(dataset, representation_function, num_train, batch_size, show_progress=False)
     assert mus_train.shape[1] == num_train
     assert ys_train.shape[1] == num_train
-    mus_test, ys_test = utils.generate_batch_factor_code(dataset, representation_function, num_test, batch_size, show_progress=False)
 
     log.debug("Computing DCI metric.")
-    scores = _compute_dci(mus_train, ys_train, mus_test, ys_test, boost_mode=boost_mode, show_progress=show_progress)
+    # sample the test set in the background while the cpu-bound factor
+    # models fit, only the fits need the training set
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future_test = executor.submit(utils.generate_batch_factor_code, dataset, representation_function, num_test, batch_size)
+        importance_matrix, train_accs, models = _fit_importance_gbt(mus_train, ys_train, boost_mode=boost_mode, early_stop=early_stop, show_progress=show_progress)
+        mus_test, ys_test = future_test.result()
+    test_err = _score_models_gbt(models, mus_test, ys_test)
 
-    return scores
+    assert importance_matrix.shape[0] == mus_train.shape[0]
+    assert importance_matrix.shape[1] == ys_train.shape[0]
+    return _dci_scores(importance_matrix, np.mean(train_accs), test_err)
 
 
-def _compute_dci(mus_train, ys_train, mus_test, ys_test, boost_mode='sklearn', show_progress=False):
+def _compute_dci(mus_train, ys_train, mus_test, ys_test, boost_mode='sklearn', early_stop=False, show_progress=False):
     """Computes score based on both training and testing codes and factors."""
-    importance_matrix, train_err, test_err = _compute_importance_gbt(mus_train, ys_train, mus_test, ys_test, boost_mode=boost_mode, show_progress=show_progress)
+    importance_matrix, train_err, test_err = _compute_importance_gbt(mus_train, ys_train, mus_test, ys_test, boost_mode=boost_mode, early_stop=early_stop, show_progress=show_progress)
     assert importance_matrix.shape[0] == mus_train.shape[0]
     assert importance_matrix.shape[1] == ys_train.shape[0]
+    return _dci_scores(importance_matrix, train_err, test_err)
+
+
+def _dci_scores(importance_matrix, train_err, test_err):
     return {
         "dci.informativeness_train": train_err,                      # "dci.explicitness" -- Measuring Disentanglement: A Review of Metrics
         "dci.informativeness_test": test_err,                        # "dci.explicitness" -- Measuring Disentanglement: A Review of Metrics
@@ -97,61 +111,114 @@ def _compute_dci(mus_train, ys_train, mus_test, ys_test, boost_mode='sklearn', s
     }
 
 
-def _compute_importance_gbt(x_train, y_train, x_test, y_test, boost_mode='sklearn', show_progress=False):
-    """Compute importance based on gradient boosted trees."""
+def _make_boost_model(boost_mode: str, early_stop: bool = False):
+    if boost_mode == 'sklearn':
+        from sklearn.ensemble import GradientBoostingClassifier
+        # early stopping holds out a validation split and stops boosting
+        # once it plateaus, usually well before the full 100 stages
+        return GradientBoostingClassifier(n_iter_no_change=5) if early_stop else GradientBoostingClassifier()
+    elif boost_mode == 'sklearn_hist':
+        # histogram-binned variant, usually 10-50x faster to fit than the
+        # exact-split GradientBoostingClassifier on dci-sized data, but it
+        # does not reproduce the reference disentanglement_lib scores
+        from sklearn.ensemble import HistGradientBoostingClassifier
+        return HistGradientBoostingClassifier(early_stopping=early_stop)
+    elif boost_mode == 'xgboost':
+        from xgboost import XGBClassifier
+        # single-threaded per model, the per-factor fits already fan out
+        # across all the cores and would otherwise oversubscribe them
+        return XGBClassifier(n_jobs=1)
+    elif boost_mode == 'lightgbm':
+        from lightgbm import LGBMClassifier
+        # single-threaded per model, see above -- lightgbm has no true
+        # multi-output fit (it boosts one model per target internally),
+        # so one fit per factor across the joblib pool is the batched form
+        return LGBMClassifier(n_jobs=1)
+    else:
+        raise KeyError(f'Invalid boosting mode: {boost_mode=}')
+
+
+def _fit_importance_gbt(x_train, y_train, boost_mode='sklearn', early_stop=False, show_progress=False):
+    """Fit one booster per factor, returning importances, train accuracies & the fitted models."""
     num_factors = y_train.shape[0]
-    num_codes = x_train.shape[0]
-    importance_matrix = np.zeros(shape=[num_codes, num_factors], dtype=np.float64)
-    train_loss = []
-    test_loss = []
-    for i in tqdm(range(num_factors), disable=(not show_progress)):
-        if boost_mode == 'sklearn':
-            from sklearn.ensemble import GradientBoostingClassifier
-            model = GradientBoostingClassifier()
-        elif boost_mode == 'xgboost':
-            from xgboost import XGBClassifier
-            model = XGBClassifier()
-        elif boost_mode == 'lightgbm':
-            from lightgbm import LGBMClassifier
-            model = LGBMClassifier()
+    # transpose to the (num_points, num_codes) layout once, instead of
+    # re-transposing (and re-copying) for every fit/predict call below
+    xT_train = np.ascontiguousarray(x_train.T)
+
+    def _fit_factor(i):
+        model = _make_boost_model(boost_mode, early_stop=early_stop)
+        model.fit(xT_train, y_train[i, :])
+        if hasattr(model, 'feature_importances_'):
+            importance = np.abs(model.feature_importances_)
         else:
-            raise KeyError(f'Invalid boosting mode: {boost_mode=}')
+            # hist gradient boosting does not expose impurity importances
+            from sklearn.inspection import permutation_importance
+            importance = np.abs(permutation_importance(model, xT_train, y_train[i, :], n_repeats=5, random_state=0).importances_mean)
+        # score() compares in compiled code, without the boolean temporary
+        # that np.mean(predict(...) == y) allocates
+        train_acc = model.score(xT_train, y_train[i, :])
+        return importance, train_acc, model
 
-        model.fit(x_train.T, y_train[i, :])
-        importance_matrix[:, i] = np.abs(model.feature_importances_)
-        train_loss.append(np.mean(model.predict(x_train.T) == y_train[i, :]))
-        test_loss.append(np.mean(model.predict(x_test.T) == y_test[i, :]))
+    # each factor is a completely independent (cpu-bound) fit, so train
+    # them in parallel across all the cores instead of a serial loop
+    results = Parallel(n_jobs=-1)(delayed(_fit_factor)(i) for i in tqdm(range(num_factors), disable=(not show_progress)))
+    importances, train_accs, models = zip(*results)
+    importance_matrix = np.stack(importances, axis=1).astype(np.float64)
 
-    return importance_matrix, np.mean(train_loss), np.mean(test_loss)
+    return importance_matrix, train_accs, models
+
+
+def _score_models_gbt(models, x_test, y_test):
+    """Mean accuracy of the fitted per-factor models over the test codes."""
+    xT_test = np.ascontiguousarray(x_test.T)
+    return np.mean([model.score(xT_test, y_test[i, :]) for i, model in enumerate(models)])
+
+
+def _compute_importance_gbt(x_train, y_train, x_test, y_test, boost_mode='sklearn', early_stop=False, show_progress=False):
+    """Compute importance based on gradient boosted trees."""
+    importance_matrix, train_accs, models = _fit_importance_gbt(x_train, y_train, boost_mode=boost_mode, early_stop=early_stop, show_progress=show_progress)
+    return importance_matrix, np.mean(train_accs), _score_models_gbt(models, x_test, y_test)
 
 
 def _disentanglement_per_code(importance_matrix):
     """Compute disentanglement score of each code."""
     # importance_matrix is of shape [num_codes, num_factors].
-    return 1. - scipy.stats.entropy(importance_matrix.T + 1e-11, base=importance_matrix.shape[1])
+    # - inlined normalised entropy over the factors (base num_factors),
+    #   scipy.stats.entropy allocates extra temporaries & re-checks args
+    p = importance_matrix + 1e-11
+    p = p / p.sum(axis=1, keepdims=True)
+    return 1. - (-(p * np.log(p)).sum(axis=1) / np.log(importance_matrix.shape[1]))
 
 
 def _disentanglement(importance_matrix):
     """Compute the disentanglement score of the representation."""
     per_code = _disentanglement_per_code(importance_matrix)
-    if importance_matrix.sum() == 0.:
-        importance_matrix = np.ones_like(importance_matrix)
-    code_importance = importance_matrix.sum(axis=1) / importance_matrix.sum()
+    # reuse the axis sums for the total instead of re-reducing the whole
+    # matrix, and weight uniformly instead of summing a ones matrix
+    code_totals = importance_matrix.sum(axis=1)
+    total = code_totals.sum()
+    code_importance = (code_totals / total) if (total != 0.) else np.full(len(code_totals), 1. / len(code_totals))
     return np.sum(per_code * code_importance)
 
 
 def _completeness_per_factor(importance_matrix):
     """Compute completeness of each factor."""
     # importance_matrix is of shape [num_codes, num_factors].
-    return 1. - scipy.stats.entropy(importance_matrix + 1e-11, base=importance_matrix.shape[0])
+    # - inlined normalised entropy over the codes (base num_codes), see
+    #   the note in `_disentanglement_per_code`
+    p = importance_matrix + 1e-11
+    p = p / p.sum(axis=0, keepdims=True)
+    return 1. - (-(p * np.log(p)).sum(axis=0) / np.log(importance_matrix.shape[0]))
 
 
 def _completeness(importance_matrix):
     """"Compute completeness of the representation."""
     per_factor = _completeness_per_factor(importance_matrix)
-    if importance_matrix.sum() == 0.:
-        importance_matrix = np.ones_like(importance_matrix)
-    factor_importance = importance_matrix.sum(axis=0) / importance_matrix.sum()
+    # reuse the axis sums for the total instead of re-reducing the whole
+    # matrix, and weight uniformly instead of summing a ones matrix
+    factor_totals = importance_matrix.sum(axis=0)
+    total = factor_totals.sum()
+    factor_importance = (factor_totals / total) if (total != 0.) else np.full(len(factor_totals), 1. / len(factor_totals))
     return np.sum(per_factor * factor_importance)
 
 
@@ -31,11 +31,21 @@ import torch
 # ========================================================================= #
 
 
+# half precision floats as produced under autocast, the elementwise loss
+# math stays in the faster reduced precision, but reductions accumulate in
+# float32 so the sums neither overflow nor lose precision
+_HALF_DTYPES = (torch.float16, torch.bfloat16)
+
+
 def loss_reduction_mean(x: torch.Tensor) -> torch.Tensor:
+    if x.dtype in _HALF_DTYPES:
+        return x.mean(dtype=torch.float32)
     return x.mean()
 
 
 def loss_reduction_mean_sum(x: torch.Tensor) -> torch.Tensor:
+    if x.dtype in _HALF_DTYPES:
+        return torch.flatten(x, start_dim=1).sum(dim=-1, dtype=torch.float32).mean()
     return torch.flatten(x, start_dim=1).sum(dim=-1).mean()
 
 
@@ -49,6 +59,17 @@ def loss_reduction(tensor: torch.Tensor, reduction='mean'):
     return _LOSS_REDUCTION_STRATEGIES[reduction](tensor)
 
 
+def get_loss_reduction_fn(reduction='mean'):
+    """
+    Resolve the reduction strategy once, so hot loops can call the
+    returned function directly instead of dispatching per batch.
+    """
+    try:
+        return _LOSS_REDUCTION_STRATEGIES[reduction]
+    except KeyError:
+        raise KeyError(f'invalid reduction mode: {repr(reduction)}, must be one of: {sorted(_LOSS_REDUCTION_STRATEGIES.keys())}')
+
+
 # ========================================================================= #
 # Reduction Strategies                                                      #
 # ========================================================================= #
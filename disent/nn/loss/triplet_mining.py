@@ -57,7 +57,8 @@ def _delta_mine_hard_neg(dist_ap: torch.Tensor, dist_an: torch.Tensor, top_k: in
     # HARD NEGATIVE MINING
     # "most similar images which have a different label from the anchor image"
     # -- triples with smallest d(a, n)
-    hard_idxs = torch.argsort(dist_an, descending=False)[:int(top_k)]
+    # - topk is a partial sort, O(B log k) instead of a full O(B log B) argsort
+    hard_idxs = torch.topk(dist_an, k=min(int(top_k), len(dist_an)), largest=False).indices
     return hard_idxs
 
 
@@ -71,14 +72,14 @@ def _delta_mine_hard_pos(dist_ap: torch.Tensor, dist_an: torch.Tensor, top_k: in
     # HARD POSITIVE MINING -- this performs really well!
     # "least similar images which have the same label to as anchor image"
     # -- shown not to be suitable for all datasets
-    hard_idxs = torch.argsort(dist_ap, descending=True)[:int(top_k)]
+    hard_idxs = torch.topk(dist_ap, k=min(int(top_k), len(dist_ap)), largest=True).indices
     return hard_idxs
 
 
 def _delta_mine_easy_pos(dist_ap: torch.Tensor, dist_an: torch.Tensor, top_k: int, margin_max: float):
     # EASY POSITIVE MINING
     # "the most similar images that have the same label as the anchor image"
-    easy_idxs = torch.argsort(dist_ap, descending=False)[:int(top_k)]
+    easy_idxs = torch.topk(dist_ap, k=min(int(top_k), len(dist_ap)), largest=False).indices
     return easy_idxs
 
 
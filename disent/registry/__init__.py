@@ -39,6 +39,9 @@ eg. `DATASET.register(...options...)(your_function_or_class)`
 # from disent.registry._registry import DictProviders
 # from disent.registry._registry import RegexProvidersSearch
 
+from types import MappingProxyType
+from typing import Mapping
+
 from disent.registry._registry import StaticValue
 from disent.registry._registry import LazyValue
 from disent.registry._registry import LazyImport
@@ -166,40 +169,47 @@ LATENT_HANDLERS['laplace'] = LazyImport('disent.frameworks.helper.latent_distrib
 # default learning rate for each optimizer
 _LR = 1e-3
 
+# compact (key, path) table, registered in one loop below -- this keeps the
+# module code object small compared to 30 discrete registration statements
+_OPTIMIZER_IMPORTS = (
+    # [torch]
+    ('adadelta',    'torch.optim.adadelta.Adadelta'),
+    ('adagrad',     'torch.optim.adagrad.Adagrad'),
+    ('adam',        'torch.optim.adam.Adam'),
+    ('adamax',      'torch.optim.adamax.Adamax'),
+    ('adam_w',      'torch.optim.adamw.AdamW'),
+    ('asgd',        'torch.optim.asgd.ASGD'),
+    ('lbfgs',       'torch.optim.lbfgs.LBFGS'),
+    ('rmsprop',     'torch.optim.rmsprop.RMSprop'),
+    ('rprop',       'torch.optim.rprop.Rprop'),
+    ('sgd',         'torch.optim.sgd.SGD'),
+    ('sparse_adam', 'torch.optim.sparse_adam.SparseAdam'),
+    # [torch_optimizer]
+    ('acc_sgd',     'torch_optimizer.AccSGD'),
+    ('ada_bound',   'torch_optimizer.AdaBound'),
+    ('ada_mod',     'torch_optimizer.AdaMod'),
+    ('adam_p',      'torch_optimizer.AdamP'),
+    ('agg_mo',      'torch_optimizer.AggMo'),
+    ('diff_grad',   'torch_optimizer.DiffGrad'),
+    ('lamb',        'torch_optimizer.Lamb'),
+    # 'torch_optimizer.Lookahead' is skipped because it is wrapped
+    ('novograd',    'torch_optimizer.NovoGrad'),
+    ('pid',         'torch_optimizer.PID'),
+    ('qh_adam',     'torch_optimizer.QHAdam'),
+    ('qhm',         'torch_optimizer.QHM'),
+    ('radam',       'torch_optimizer.RAdam'),
+    ('ranger',      'torch_optimizer.Ranger'),
+    ('ranger_qh',   'torch_optimizer.RangerQH'),
+    ('ranger_va',   'torch_optimizer.RangerVA'),
+    ('sgd_w',       'torch_optimizer.SGDW'),
+    ('sgd_p',       'torch_optimizer.SGDP'),
+    ('shampoo',     'torch_optimizer.Shampoo'),
+    ('yogi',        'torch_optimizer.Yogi'),
+)
+
 OPTIMIZERS: RegistryImports['torch.optim.Optimizer'] = RegistryImports('OPTIMIZERS')
-# [torch]
-OPTIMIZERS['adadelta']    = LazyImport(lr=_LR, import_path='torch.optim.adadelta.Adadelta')
-OPTIMIZERS['adagrad']     = LazyImport(lr=_LR, import_path='torch.optim.adagrad.Adagrad')
-OPTIMIZERS['adam']        = LazyImport(lr=_LR, import_path='torch.optim.adam.Adam')
-OPTIMIZERS['adamax']      = LazyImport(lr=_LR, import_path='torch.optim.adamax.Adamax')
-OPTIMIZERS['adam_w']      = LazyImport(lr=_LR, import_path='torch.optim.adamw.AdamW')
-OPTIMIZERS['asgd']        = LazyImport(lr=_LR, import_path='torch.optim.asgd.ASGD')
-OPTIMIZERS['lbfgs']       = LazyImport(lr=_LR, import_path='torch.optim.lbfgs.LBFGS')
-OPTIMIZERS['rmsprop']     = LazyImport(lr=_LR, import_path='torch.optim.rmsprop.RMSprop')
-OPTIMIZERS['rprop']       = LazyImport(lr=_LR, import_path='torch.optim.rprop.Rprop')
-OPTIMIZERS['sgd']         = LazyImport(lr=_LR, import_path='torch.optim.sgd.SGD')
-OPTIMIZERS['sparse_adam'] = LazyImport(lr=_LR, import_path='torch.optim.sparse_adam.SparseAdam')
-# [torch_optimizer]
-OPTIMIZERS['acc_sgd']     = LazyImport(lr=_LR, import_path='torch_optimizer.AccSGD')
-OPTIMIZERS['ada_bound']   = LazyImport(lr=_LR, import_path='torch_optimizer.AdaBound')
-OPTIMIZERS['ada_mod']     = LazyImport(lr=_LR, import_path='torch_optimizer.AdaMod')
-OPTIMIZERS['adam_p']      = LazyImport(lr=_LR, import_path='torch_optimizer.AdamP')
-OPTIMIZERS['agg_mo']      = LazyImport(lr=_LR, import_path='torch_optimizer.AggMo')
-OPTIMIZERS['diff_grad']   = LazyImport(lr=_LR, import_path='torch_optimizer.DiffGrad')
-OPTIMIZERS['lamb']        = LazyImport(lr=_LR, import_path='torch_optimizer.Lamb')
-# 'torch_optimizer.Lookahead' is skipped because it is wrapped
-OPTIMIZERS['novograd']    = LazyImport(lr=_LR, import_path='torch_optimizer.NovoGrad')
-OPTIMIZERS['pid']         = LazyImport(lr=_LR, import_path='torch_optimizer.PID')
-OPTIMIZERS['qh_adam']     = LazyImport(lr=_LR, import_path='torch_optimizer.QHAdam')
-OPTIMIZERS['qhm']         = LazyImport(lr=_LR, import_path='torch_optimizer.QHM')
-OPTIMIZERS['radam']       = LazyImport(lr=_LR, import_path='torch_optimizer.RAdam')
-OPTIMIZERS['ranger']      = LazyImport(lr=_LR, import_path='torch_optimizer.Ranger')
-OPTIMIZERS['ranger_qh']   = LazyImport(lr=_LR, import_path='torch_optimizer.RangerQH')
-OPTIMIZERS['ranger_va']   = LazyImport(lr=_LR, import_path='torch_optimizer.RangerVA')
-OPTIMIZERS['sgd_w']       = LazyImport(lr=_LR, import_path='torch_optimizer.SGDW')
-OPTIMIZERS['sgd_p']       = LazyImport(lr=_LR, import_path='torch_optimizer.SGDP')
-OPTIMIZERS['shampoo']     = LazyImport(lr=_LR, import_path='torch_optimizer.Shampoo')
-OPTIMIZERS['yogi']        = LazyImport(lr=_LR, import_path='torch_optimizer.Yogi')
+for _key, _path in _OPTIMIZER_IMPORTS:
+    OPTIMIZERS[_key] = LazyImport(lr=_LR, import_path=_path)
 
 
 # ========================================================================= #
@@ -271,17 +281,22 @@ KERNELS.register_regex(pattern=r'^gau_r(\d+)$', example='gau_r31', factory_fn='d
 
 
 # registry of registries
-REGISTRIES: Registry[Registry] = Registry('REGISTRIES')
-REGISTRIES['DATASETS']        = StaticValue(DATASETS)
-REGISTRIES['SAMPLERS']        = StaticValue(SAMPLERS)
-REGISTRIES['FRAMEWORKS']      = StaticValue(FRAMEWORKS)
-REGISTRIES['RECON_LOSSES']    = StaticValue(RECON_LOSSES)
-REGISTRIES['LATENT_HANDLERS'] = StaticValue(LATENT_HANDLERS)
-REGISTRIES['OPTIMIZERS']      = StaticValue(OPTIMIZERS)
-REGISTRIES['METRICS']         = StaticValue(METRICS)
-REGISTRIES['SCHEDULES']       = StaticValue(SCHEDULES)
-REGISTRIES['MODELS']          = StaticValue(MODELS)
-REGISTRIES['KERNELS']         = StaticValue(KERNELS)
+# - a read-only mapping view instead of a mutable Registry of StaticValue
+#   wrappers: lookups are a single dict hit, and the collection of
+#   registries itself cannot be mutated (the individual registries can
+#   of course still be registered into)
+REGISTRIES: Mapping[str, Registry] = MappingProxyType({
+    'DATASETS':        DATASETS,
+    'SAMPLERS':        SAMPLERS,
+    'FRAMEWORKS':      FRAMEWORKS,
+    'RECON_LOSSES':    RECON_LOSSES,
+    'LATENT_HANDLERS': LATENT_HANDLERS,
+    'OPTIMIZERS':      OPTIMIZERS,
+    'METRICS':         METRICS,
+    'SCHEDULES':       SCHEDULES,
+    'MODELS':          MODELS,
+    'KERNELS':         KERNELS,
+})
 
 
 # ========================================================================= #
@@ -24,6 +24,7 @@
 
 import inspect
 import re
+import sys
 from abc import ABC
 from typing import Any
 from typing import Callable
@@ -74,6 +75,10 @@ class ProvidedValue(Generic[V], ABC):
     - Subclasses should override this
     """
 
+    # keep subclasses dict-free, many wrapper instances are created at
+    # import time and kept alive for the lifetime of the process
+    __slots__ = ()
+
     def get(self) -> V:
         raise NotImplementedError
 
@@ -87,6 +92,8 @@ class StaticValue(ProvidedValue[V]):
     around already generated / constant values.
     """
 
+    __slots__ = ('_value',)
+
     def __init__(self, value: V):
         self._value = value
 
@@ -98,6 +105,9 @@ class StaticValue(ProvidedValue[V]):
 
 
 class StaticImport(StaticValue[V]):
+
+    __slots__ = ()
+
     def __init__(self, fn: V, *partial_args, **partial_kwargs):
         super().__init__(wrapped_partial(fn, *partial_args, **partial_kwargs))
 
@@ -108,6 +118,8 @@ class LazyValue(ProvidedValue[V]):
     the result only when this value is first needed.
     """
 
+    __slots__ = ('_generate_fn', '_is_generated', '_value')
+
     def __init__(self, generate_fn: Callable[[], V]):
         assert callable(generate_fn)
         self._generate_fn = generate_fn
@@ -115,10 +127,12 @@ class LazyValue(ProvidedValue[V]):
         self._value = None
 
     def get(self) -> V:
-        # cache the value
+        # cache the value -- only mark as generated once the generator has
+        # actually succeeded, otherwise a failed import would poison the
+        # cache and return None forever after
         if not self._is_generated:
-            self._is_generated = True
             self._value = self._generate_fn()
+            self._is_generated = True
         return self._value
 
     def clear(self):
@@ -137,7 +151,13 @@ class LazyImport(LazyValue[V]):
       the same as importing the value directly when `get` is called!
     """
 
+    __slots__ = ()
+
     def __init__(self, import_path: str, *partial_args, **partial_kwargs):
+        # check & split the dotted path once at construction -- typos then
+        # fail at registration time, and resolve() (which is memoized by
+        # LazyValue) never re-parses the path
+        _check_and_split_path(import_path)
         # function imports the object when called
         def generate_fn():
             return import_obj_partial(import_path, *partial_args, **partial_kwargs)
@@ -246,8 +266,10 @@ class Registry(DictProviders[str, V]):
         # check the value
         v = self._check_and_normalise_value(v)
         # set all the aliases
+        # - interned keys compare by pointer identity in the dict fast
+        #   path on lookup, skipping byte-wise equality
         for k in aliases:
-            self._setitem(k, v)
+            self._setitem(sys.intern(k), v)
 
     def _normalise_aliases(self, aliases: AliasesHint, check_nonempty: bool = True) -> Tuple[str]:
         if isinstance(aliases, str):
@@ -386,14 +408,6 @@ class RegistryImports(Registry[V]):
             raise TypeError(f'Values stored in registry: {repr(self.name)} must be instances of: {(LazyImport.__name__, StaticImport.__name__)}, got: {repr(v)}')
         return v
 
-    # --- OVERRIDABLE --- #
-
-    def _check_provided_value(self, v: V) -> NoReturn:
-        pass
-
-    def _check_key(self, k: str) -> NoReturn:
-        pass
-
 
 # ========================================================================= #
 # Dynamic Registry                                                          #
@@ -23,6 +23,7 @@
 #  ~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~
 
 import logging
+import sys
 from functools import wraps
 from typing import Optional
 
@@ -65,6 +66,13 @@ def _get_stack_file_strings():
     return results[::-1]
 
 
+def _get_frame_file_string(depth: int) -> str:
+    # cheap single-frame lookup, `inspect.stack()` walks every frame and
+    # reads the source context for each, which is much slower
+    frame = sys._getframe(depth)
+    return f'File "{frame.f_code.co_filename}", line {frame.f_lineno}, in {frame.f_code.co_name}'
+
+
 _TRACEBACK_MODES = {'none', 'first', 'mini', 'traceback'}
 DEFAULT_TRACEBACK_MODE = 'first'
 
@@ -97,7 +105,7 @@ def deprecated(msg: str, traceback_mode: Optional[str] = None, fn=None):
                 logger = logging.getLogger(name)
                 logger.warning(f'[DEPRECATED] {path} - {repr(dsc)}')
                 # get stack trace lines
-                if traceback_mode == 'first': lines = _get_stack_file_strings()[-3:-2]
+                if traceback_mode == 'first': lines = [_get_frame_file_string(2)]
                 elif traceback_mode == 'mini': lines = _get_stack_file_strings()[:-2]
                 elif traceback_mode == 'traceback': lines = (l[2:] for g in _get_traceback_file_groups()[:-3] for l in g)
                 else: lines = []
@@ -23,6 +23,7 @@
 #  ~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~
 
 
+from functools import lru_cache
 from typing import Tuple
 
 
@@ -40,17 +41,26 @@ def _check_and_split_path(import_path: str) -> Tuple[str, ...]:
     return tuple(segments)
 
 
+@lru_cache(maxsize=None)
 def import_obj(import_path: str):
+    # repeated resolution of the same dotted path (eg. regex registry
+    # factories, user code re-looking-up the same entries) is a cache hit
+    # instead of an importlib round-trip + getattr walk
     # checks
     segments = _check_and_split_path(import_path)
     # split path
     module_path, attr_name = '.'.join(segments[:-1]), segments[-1]
     # import the module
-    import importlib
-    try:
-        module = importlib.import_module(module_path)
-    except Exception as e:
-        raise ImportError(f'failed to import module: {repr(module_path)}') from e
+    # - check sys.modules first, already-loaded modules (eg. siblings that
+    #   share a parent package) then skip the full importlib machinery
+    import sys
+    module = sys.modules.get(module_path, None)
+    if module is None:
+        import importlib
+        try:
+            module = importlib.import_module(module_path)
+        except Exception as e:
+            raise ImportError(f'failed to import module: {repr(module_path)}') from e
     # import the attrs
     try:
         attr = getattr(module, attr_name)
@@ -228,28 +228,35 @@ class VaeLatentCycleLoggingCallback(BaseCallbackPeriodic):
             batch, indices = dataset.dataset_sample_batch(num_stats_samples, mode='input', replace=True, return_indices=True)  # replace just in case the dataset it tiny
             batch = batch.to(vae.device)
 
-        # get representations
-        if isinstance(vae, Vae):
-            # variational auto-encoder
-            ds_posterior, ds_prior = vae.encode_dists(batch)
-            zs_mean, zs_logvar = ds_posterior.mean, torch.log(ds_posterior.variance)
-        elif isinstance(vae, Ae):
-            # auto-encoder
-            zs_mean = vae.encode(batch)
-            zs_logvar = torch.ones_like(zs_mean)
-        else:
-            log.warning(f'cannot run {cls.__name__}, unsupported type: {type(vae)}, must be {Ae.__name__} or {Vae.__name__}')
-            return
-
-        # get min and max if auto
-        if (recon_min is None) or (recon_max is None):
-            if recon_min is None: recon_min = float(torch.amin(batch).cpu())
-            if recon_max is None: recon_max = float(torch.amax(batch).cpu())
-            log.info(f'auto visualisation min: {recon_min} and max: {recon_max} obtained from {len(batch)} samples')
-
-        # produce latent cycle still images & convert them to images
-        stills = make_decoded_latent_cycles(vae.decode, zs_mean, zs_logvar, mode=mode, num_animations=1, num_frames=num_frames, decoder_device=vae.device)[0]
-        stills = torch_to_images(stills, in_dims='CHW', out_dims='HWC', in_min=recon_min, in_max=recon_max, always_rgb=True, to_numpy=True)
+        # these forward passes are for logging only, so skip gradient
+        # tracking and run under autocast when on the gpu
+        # - no_grad (not inference_mode!) so that no inference tensors can
+        #   leak into caches shared with the training step
+        with torch.no_grad(), torch.autocast(device_type='cuda', enabled=(batch.is_cuda)):
+            # get representations
+            if isinstance(vae, Vae):
+                # variational auto-encoder
+                ds_posterior, ds_prior = vae.encode_dists(batch)
+                zs_mean, zs_logvar = ds_posterior.mean, torch.log(ds_posterior.variance)
+            elif isinstance(vae, Ae):
+                # auto-encoder
+                zs_mean = vae.encode(batch)
+                zs_logvar = torch.ones_like(zs_mean)
+            else:
+                log.warning(f'cannot run {cls.__name__}, unsupported type: {type(vae)}, must be {Ae.__name__} or {Vae.__name__}')
+                return
+
+            # get min and max if auto
+            if (recon_min is None) or (recon_max is None):
+                if recon_min is None: recon_min = float(torch.amin(batch).cpu())
+                if recon_max is None: recon_max = float(torch.amax(batch).cpu())
+                log.info(f'auto visualisation min: {recon_min} and max: {recon_max} obtained from {len(batch)} samples')
+
+            # produce latent cycle still images
+            stills = make_decoded_latent_cycles(vae.decode, zs_mean, zs_logvar, mode=mode, num_animations=1, num_frames=num_frames, decoder_device=vae.device)[0]
+
+        # convert them to images (back at full precision outside autocast)
+        stills = torch_to_images(stills.float(), in_dims='CHW', out_dims='HWC', in_min=recon_min, in_max=recon_max, always_rgb=True, to_numpy=True)
 
         # generate the video frames and image grid from the stills
         # - TODO: this needs to be fixed to not use logvar, but rather the representations or distributions themselves
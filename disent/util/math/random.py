@@ -41,7 +41,10 @@ def random_choice_prng(a, size=None, replace=True, seed: int = None):
     # - PCG64 has good statistical properties and is fast: https://numpy.org/doc/stable/reference/random/performance.html
     g = np.random.Generator(np.random.PCG64(seed=seed))
     # sample indices
-    choices = g.choice(a, size=size, replace=replace)
+    # - shuffle=False lets the generator use Floyd's O(size) sampling for
+    #   replace=False draws instead of permuting the entire range, which
+    #   matters when drawing small batches from very large datasets
+    choices = g.choice(a, size=size, replace=replace, shuffle=False)
     # done!
     return choices
 
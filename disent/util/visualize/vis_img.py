@@ -336,7 +336,11 @@ def torch_to_images(
     # 6. convert to rgb
     if always_rgb:
         if tensor.shape[out_c_dim] == 1:
-            tensor = torch.repeat_interleave(tensor, 3, dim=out_c_dim)  # torch.repeat is like np.tile, torch.repeat_interleave is like np.repeat
+            # zero-copy broadcast view over the greyscale channel instead of
+            # materialising the tripled tensor with repeat_interleave
+            shape = list(tensor.shape)
+            shape[out_c_dim] = 3
+            tensor = tensor.expand(shape)
     # 7. check output dtype
     if out_dtype != tensor.dtype:
         raise RuntimeError(f'[THIS IS A BUG!]: After conversion, images tensor dtype: {repr(tensor.dtype)} does not match out_dtype: {repr(in_dtype)}')
@@ -344,7 +348,12 @@ def torch_to_images(
         raise RuntimeError('[THIS IS A BUG!]: After conversion, images contain NaN values!')
     # convert to numpy
     if to_numpy:
-        return tensor.detach().cpu().numpy()
+        array = tensor.detach().cpu().numpy()
+        # broadcast rgb channels share memory, block accidental writes that
+        # would otherwise silently land in all three channels
+        if 0 in array.strides:
+            array.flags.writeable = False
+        return array
     return tensor
 
 
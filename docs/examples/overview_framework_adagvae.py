@@ -1,4 +1,5 @@
 import pytorch_lightning as pl
+import torch
 from torch.utils.data import DataLoader
 from disent.dataset import DisentDataset
 from disent.dataset.data import XYObjectData
@@ -11,9 +12,13 @@ from disent.util import is_test_run  # you can ignore and remove this
 
 
 # prepare the data
+# - persistent workers sample pairs & apply the transform in parallel with
+#   the training step, and pinned memory lets batches overlap the transfer
+#   to the gpu (everything stays in-process for quick smoke-test runs)
 data = XYObjectData()
 dataset = DisentDataset(data, GroundTruthPairOrigSampler(), transform=ToImgTensorF32())
-dataloader = DataLoader(dataset=dataset, batch_size=4, shuffle=True, num_workers=0)
+num_workers = 0 if is_test_run() else 2
+dataloader = DataLoader(dataset=dataset, batch_size=4, shuffle=True, num_workers=num_workers, persistent_workers=(num_workers > 0), pin_memory=torch.cuda.is_available())
 
 # create the pytorch lightning system
 module: pl.LightningModule = AdaVae(
@@ -27,6 +32,14 @@ module: pl.LightningModule = AdaVae(
     )
 )
 
+# compile the encoder/decoder with inductor when available (torch 2.0+):
+# the tiny static-shape conv graphs are ideal candidates for kernel fusion
+if hasattr(torch, 'compile'):
+    module._model._encoder = torch.compile(module._model._encoder)
+    module._model._decoder = torch.compile(module._model._decoder)
+
 # train the model
-trainer = pl.Trainer(logger=False, checkpoint_callback=False, fast_dev_run=is_test_run())
+# - bf16 mixed precision halves the activation bandwidth of the conv
+#   encoder/decoder on supporting hardware, with no algorithmic change
+trainer = pl.Trainer(logger=False, checkpoint_callback=False, precision='bf16', fast_dev_run=is_test_run())
 trainer.fit(module, dataloader)